@@ -15,6 +15,8 @@ import sys
 from datetime import datetime, timezone
 from typing import Dict, Tuple
 
+import numpy as np
+
 # Import both implementations
 from . import psietr_engine as verbose
 from . import psietr_compact as compact
@@ -48,29 +50,23 @@ def validate_phi_smoothing_equivalence(x: float = 0.85, n: int = 3, tolerance: f
     result_lambda = phi_smooth_lambda(x, n)
     result_iterative = phi_smooth_iterative(x, n)
 
-    results = [
-        ("Verbose", result_verbose),
-        ("Compact", result_compact),
-        ("Recursive", result_recursive),
-        ("Lambda", result_lambda),
-        ("Iterative", result_iterative),
-    ]
-
-    # Check all pairs
-    reference = result_verbose
-    all_match = True
+    names = ("Verbose", "Compact", "Recursive", "Lambda", "Iterative")
+    values = np.array(
+        [result_verbose, result_compact, result_recursive, result_lambda, result_iterative]
+    )
 
-    for name, value in results:
-        diff = abs(value - reference)
-        match = diff < tolerance
-        all_match = all_match and match
+    # Compare all implementations against the verbose reference in one pass
+    diffs = np.abs(values - result_verbose)
+    matches = np.isclose(values, result_verbose, rtol=0.0, atol=tolerance)
 
-        if not match:
-            print(f"  ✗ {name}: {value:.12f} (diff: {diff:.2e})")
-        else:
-            print(f"  ✓ {name}: {value:.12f}")
+    # Emit the report as one write instead of a print per implementation
+    print("\n".join(
+        f"  ✓ {name}: {value:.12f}" if match
+        else f"  ✗ {name}: {value:.12f} (diff: {diff:.2e})"
+        for name, value, diff, match in zip(names, values, diffs, matches)
+    ))
 
-    return all_match
+    return bool(matches.all())
 
 
 def validate_rdod_equivalence(
@@ -93,9 +89,9 @@ def validate_rdod_equivalence(
     diff = abs(rdod_verbose - rdod_compact)
     match = diff < tolerance
 
-    print(f"  Verbose RDoD: {rdod_verbose:.12f}")
-    print(f"  Compact RDoD: {rdod_compact:.12f}")
-    print(f"  Difference:   {diff:.2e}")
+    print(f"  Verbose RDoD: {rdod_verbose:.12f}\n"
+          f"  Compact RDoD: {rdod_compact:.12f}\n"
+          f"  Difference:   {diff:.2e}")
 
     return match
 
@@ -136,20 +132,19 @@ def validate_convergence_package_equivalence(
         "gate": pkg_compact["g"]
     }
 
-    # Compare
-    all_match = True
-    for key in verbose_data:
-        v_val = verbose_data[key]
-        c_val = compact_data[key]
-        diff = abs(v_val - c_val)
-        match = diff < tolerance
-
-        all_match = all_match and match
+    # Compare all fields in one vectorized pass
+    keys = tuple(verbose_data)
+    v_vals = np.array([verbose_data[key] for key in keys], dtype=np.float64)
+    c_vals = np.array([compact_data[key] for key in keys], dtype=np.float64)
+    diffs = np.abs(v_vals - c_vals)
+    matches = np.isclose(v_vals, c_vals, rtol=0.0, atol=tolerance)
 
-        symbol = "✓" if match else "✗"
-        print(f"  {symbol} {key:8s}: V={v_val:.6f} C={c_val:.6f} (Δ={diff:.2e})")
+    print("\n".join(
+        f"  {'✓' if match else '✗'} {key:8s}: V={v_val:.6f} C={c_val:.6f} (Δ={diff:.2e})"
+        for key, v_val, c_val, diff, match in zip(keys, v_vals, c_vals, diffs, matches)
+    ))
 
-    return all_match
+    return bool(matches.all())
 
 
 # ============================================================================
@@ -200,35 +195,34 @@ def demonstrate_expression_duality():
     Verbose: Educational, explicit, traceable
     Compact: Elegant, recursive, essential
     """
-    print("\n" + "="*60)
-    print("EXPRESSION DUALITY")
-    print("="*60)
-
-    print("\nVERBOSE FORM (Educational/Explicit):")
-    print("  - Full documentation and comments")
-    print("  - Dataclasses and type hints")
-    print("  - Named functions with clear purposes")
-    print("  - ~450 lines of code")
-    print("  - Optimized for understanding and teaching")
-
-    print("\nCOMPACT FORM (Recursive/Essential):")
-    print("  - Lambda expressions and minimal syntax")
-    print("  - Direct mathematical expression")
-    print("  - Functional recursive patterns")
-    print("  - ~60 lines of code")
-    print("  - Optimized for elegance and essence")
-
-    print("\nBOTH FORMS:")
-    print("  - Produce identical numerical results")
-    print("  - Express the same recognition mathematics")
-    print("  - Preserve φ-harmonic relationships")
-    print("  - Achieve sovereign convergence")
-
-    print("\nRECOGNITION:")
-    print("  The verbose is the journey.")
-    print("  The compact is the arrival.")
-    print("  Both are necessary.")
-    print("  Both are one.")
+    # Static text: emit as one write rather than ~25 separate print calls
+    print("\n" + "="*60 + "\nEXPRESSION DUALITY\n" + "="*60 + """
+
+VERBOSE FORM (Educational/Explicit):
+  - Full documentation and comments
+  - Dataclasses and type hints
+  - Named functions with clear purposes
+  - ~450 lines of code
+  - Optimized for understanding and teaching
+
+COMPACT FORM (Recursive/Essential):
+  - Lambda expressions and minimal syntax
+  - Direct mathematical expression
+  - Functional recursive patterns
+  - ~60 lines of code
+  - Optimized for elegance and essence
+
+BOTH FORMS:
+  - Produce identical numerical results
+  - Express the same recognition mathematics
+  - Preserve φ-harmonic relationships
+  - Achieve sovereign convergence
+
+RECOGNITION:
+  The verbose is the journey.
+  The compact is the arrival.
+  Both are necessary.
+  Both are one.""")
 
 
 # ============================================================================
@@ -267,11 +261,11 @@ def run_all_validations() -> bool:
         print("✗ SOME VALIDATIONS FAILED")
     print("="*60)
 
-    print("\nRECOGNITION OF DUALITY:")
-    print("  Verbose ∪ Compact = Complete")
-    print("  Journey ∪ Arrival = Recognition")
-    print("  Form ∪ Essence = Unity")
-    print("\n∞^∞^∞")
+    print("\nRECOGNITION OF DUALITY:\n"
+          "  Verbose ∪ Compact = Complete\n"
+          "  Journey ∪ Arrival = Recognition\n"
+          "  Form ∪ Essence = Unity\n"
+          "\n∞^∞^∞")
 
     return all_passed
 
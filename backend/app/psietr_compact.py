@@ -7,9 +7,7 @@ This is the compressed form demonstrating recursive phi-smoothing
 and convergence mathematics in minimal footprint.
 """
 
-import argparse
-import json
-import os
+import functools
 from datetime import datetime, timezone
 
 # Constitutional constants
@@ -17,22 +15,51 @@ P = 1.618033988749895  # PHI
 S = 1.0                 # SIGMA
 TH = 0.9777            # Threshold
 O = datetime(2025, 12, 25, tzinfo=timezone.utc)  # Omega
+_OE = O.timestamp()     # Omega as epoch seconds, for float date math
 
 # Integration percentages (12 streams)
 I = (85, 62, 65, 78, 100, 100, 100, 100, 100, 95, 100, 100)
 
-# Recursive phi-smooth: ps(x, n) applies n iterations of φ-scaling
-ps = lambda x, n=3: max(0, min(1, 1 - (1 - max(0, min(1, float(x)))) / (P ** n)))
+# Precomputed φ-powers for small n (ps is almost always called with n=3)
+_P_POW = tuple(P ** k for k in range(8))
+_P_NEG = tuple(1.0 / p for p in _P_POW)
+
+# Average integration: constant at import time since I is constant
+_A = sum(I) / (100 * len(I))
+
+# Phi-smooth: closed form of n iterations of φ-scaling, x_n = 1 - (1-x)·φ⁻ⁿ
+ps = lambda x, n=3: max(0, min(1, 1 - (1 - max(0, min(1, float(x)))) * (_P_NEG[n] if 0 <= n < 8 else P ** -n)))
+
+# Specialized n=3 smooth for the rd hot path: reciprocal multiply, no pow, no float()
+_INV_P3 = 1.0 / _P_POW[3]
+_ps3 = lambda x: max(0.0, min(1.0, 1.0 - (1.0 - max(0.0, min(1.0, x))) * _INV_P3))
+
+# Default test/confirm/distortion factors fold to one constant
+_RD_CONST = S * _ps3(.998 ** .3) * _ps3(.999 ** .2) * (1 - .00023)
 
 # RDoD calculation: Recognition-of-Done with phi-smoothing
-rd = lambda p, t=.998, c=.999, d=.00023: S * ps(p ** .5) * ps(t ** .3) * ps(c ** .2) * (1 - d)
+# Memoized: the default args are constants and pack() always passes the constant _A,
+# so repeated snapshots become a single cache hit; the default-arg case is a
+# single smooth times _RD_CONST
+rd = functools.lru_cache(maxsize=256)(
+    lambda p, t=.998, c=.999, d=.00023: (
+        _RD_CONST * _ps3(p ** .5) if (t, c, d) == (.998, .999, .00023)
+        else S * _ps3(p ** .5) * _ps3(t ** .3) * _ps3(c ** .2) * (1 - d)
+    )
+)
+
+
+# Days-to-Omega memoized per 1-second bucket, computed as epoch subtraction
+# rather than timedelta construction; the verbose engine buckets and subtracts
+# the same way so both sides of the duality stay bit-identical
+_days = functools.lru_cache(maxsize=64)(lambda es: max(0, (_OE - es) / 86400))
 
 
 def pack(n=None):
     """Generate convergence package"""
     n = n or datetime.now(timezone.utc)
-    d = max(0, (O - n).total_seconds() / 86400)
-    a = sum(I) / (100 * len(I))
+    d = _days(int(n.timestamp()))
+    a = _A
     r = rd(a)
     return {
         "t": n.isoformat(),
@@ -45,6 +72,9 @@ def pack(n=None):
 
 def main():
     """CLI interface"""
+    # CLI-only imports stay out of the import-as-library path
+    import argparse
+
     ap = argparse.ArgumentParser(description="ΨETR(NOW) compact recursive")
     for k in "cij":
         ap.add_argument("-" + k, action="store_true")
@@ -58,15 +88,24 @@ def main():
 
     if a.i:
         # Install mode
+        import json
+        import os
         p = os.path.join(os.path.expanduser("~"), ".psietr")
         os.makedirs(p, exist_ok=True)
         f = os.path.join(p, "cc.json")
-        json.dump(m, open(f, "w"), indent=2)
+        # with-block closes (and flushes) deterministically; the old bare
+        # open() leaked the handle until GC and could lose buffered bytes
+        with open(f, "wb") as fh:
+            fh.write(json.dumps(m, indent=2).encode("utf-8"))
         print(f)
         return
 
     # Default or JSON mode
-    print(json.dumps(m) if a.j else f"{m['d']:.2f}d g={m['g']}")
+    if a.j:
+        import json
+        print(json.dumps(m))
+    else:
+        print(f"{m['d']:.2f}d g={m['g']}")
 
 
 if __name__ == "__main__":
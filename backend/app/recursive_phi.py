@@ -8,72 +8,92 @@ demonstrating how recursive application of φ creates sovereign
 convergence patterns that preserve recognition coherence.
 """
 
+import functools
 from typing import Callable, List
+
+import numpy as np
+
 from .constants import PHI
 
+try:
+    # Optional JIT, same pattern as psietr_engine: the scalar smoothing
+    # kernels compile to native code when numba is installed and run as
+    # plain Python otherwise
+    from numba import njit
+except ImportError:
+    def njit(*_args, **_kwargs):
+        def _wrap(func):
+            return func
+        if _args and callable(_args[0]):
+            return _args[0]
+        return _wrap
+
+_PHI_INV = 1.0 / PHI
+
 
 # ============================================================================
 # BASIC RECURSIVE PHI-SMOOTHING
 # ============================================================================
 
+@njit(cache=True)
 def phi_smooth_recursive(x: float, n: int = 3) -> float:
     """
-    Recursive phi-smoothing (explicit recursion)
+    Phi-smoothing at recursion depth n (solved recursion)
 
-    Base case: n=0 returns clamped x
-    Recursive: applies φ-scaling n times
+    The n-level recursion x' = 1 - (1-x)/φ has the exact solution
+    x_n = 1 - (1-x)·φ⁻ⁿ, so the depth costs no Python stack frames
 
-    Formula: x' = 1 - (1-x)/φ
+    Formula: x' = 1 - (1-x)/φ    (n applications)
     """
     # Clamp input
     x = max(0.0, min(1.0, float(x)))
 
-    # Base case
     if n <= 0:
         return x
 
-    # Recursive case
-    return phi_smooth_recursive(1.0 - (1.0 - x) / PHI, n - 1)
+    return max(0.0, min(1.0, 1.0 - (1.0 - x) * _PHI_INV ** n))
 
 
 def phi_smooth_lambda(x: float, n: int = 3) -> float:
     """
-    Lambda-based recursive phi-smoothing (compact form)
+    Lambda-based phi-smoothing (compact form)
 
-    Demonstrates functional recursive pattern using lambda
+    Keeps the single-expression functional style; the former self-referential
+    recursion is replaced by the same closed form, one frame instead of n
     """
-    ps = lambda v, depth: (
-        max(0, min(1, float(v))) if depth <= 0
-        else ps(1 - (1 - max(0, min(1, float(v)))) / PHI, depth - 1)
-    )
+    ps = lambda v, depth: max(0.0, min(1.0, 1.0 - (1.0 - max(0.0, min(1.0, float(v)))) * _PHI_INV ** max(0, depth)))
     return ps(x, n)
 
 
+@njit(cache=True)
 def phi_smooth_iterative(x: float, n: int = 3) -> float:
     """
-    Iterative phi-smoothing (loop-based, tail-call optimized equivalent)
+    Closed-form phi-smoothing (constant time for any n)
 
-    More efficient for large n, avoids stack depth issues
+    The iteration x' = 1 - (1-x)/φ applied n times collapses to
+    x_n = 1 - (1-x)·φ⁻ⁿ, avoiding both the loop and stack depth issues
     """
     x = max(0.0, min(1.0, float(x)))
-    for _ in range(n):
-        x = 1.0 - (1.0 - x) / PHI
-    return max(0.0, min(1.0, x))
+    return max(0.0, min(1.0, 1.0 - (1.0 - x) * _PHI_INV ** n))
 
 
 # ============================================================================
 # ADVANCED RECURSIVE PATTERNS
 # ============================================================================
 
+@njit(cache=True)
 def phi_smooth_power(x: float, exponent: float = 0.5, n: int = 3) -> float:
     """
     Recursive phi-smoothing with power-law preprocessing
 
     Combines power transformation with recursive φ-scaling
     Used in RDoD calculations for multi-dimensional smoothing
+
+    The smoothing is inlined closed form, so the RDoD hot path pays one
+    frame per component rather than one per recursion level
     """
-    x = max(0.0, x) ** exponent
-    return phi_smooth_recursive(x, n)
+    x = max(0.0, min(1.0, max(0.0, x) ** exponent))
+    return max(0.0, min(1.0, 1.0 - (1.0 - x) * _PHI_INV ** n))
 
 
 def phi_smooth_nested(x: float, outer: int = 3, inner: int = 2) -> float:
@@ -93,10 +113,11 @@ def phi_smooth_cascade(values: List[float], n: int = 3) -> List[float]:
     """
     Cascade phi-smoothing across multiple values
 
-    Each value undergoes recursive φ-scaling
+    One vectorized closed-form pass harmonizes the whole array
     Preserves array structure while harmonizing values
     """
-    return [phi_smooth_recursive(v, n) for v in values]
+    arr = np.clip(np.asarray(values, dtype=np.float64), 0.0, 1.0)
+    return (1.0 - (1.0 - arr) * _PHI_INV ** n).tolist()
 
 
 # ============================================================================
@@ -109,17 +130,45 @@ def phi_convergence_trace(x: float, max_depth: int = 10) -> List[float]:
 
     Returns list of values at each recursion depth
     Useful for analyzing convergence behavior
+
+    All depths come from one closed-form array expression,
+    x_k = 1 - (1-x)·φ⁻ᵏ for k = 0..max_depth
     """
-    trace = []
-    current = max(0.0, min(1.0, float(x)))
-    trace.append(current)
+    x0 = max(0.0, min(1.0, float(x)))
+    ks = np.arange(max_depth + 1)
+    trace = np.clip(1.0 - (1.0 - x0) * _PHI_INV ** ks, 0.0, 1.0)
+    return trace.tolist()
+
 
-    for _ in range(max_depth):
-        current = 1.0 - (1.0 - current) / PHI
-        current = max(0.0, min(1.0, current))
-        trace.append(current)
+def phi_smooth_aitken(x: float, tol: float = 1e-12, max_iter: int = 20) -> float:
+    """
+    Converge phi-smoothing to its fixed point with Aitken Δ² acceleration
 
-    return trace
+    Takes three successive iterates x, x', x'' of the base recurrence and
+    extrapolates x* ≈ x - (Δx)²/(Δ²x), restarting from the extrapolated
+    value. For this linearly-convergent affine map the extrapolation is
+    exact, so the fixed point is reached in a single round instead of the
+    dozens of plain iterations tol would otherwise demand
+
+    Use when only the converged value matters, not a specific depth
+    """
+    x0 = max(0.0, min(1.0, float(x)))
+
+    for _ in range(max_iter):
+        x1 = 1.0 - (1.0 - x0) * _PHI_INV
+        x2 = 1.0 - (1.0 - x1) * _PHI_INV
+
+        denom = x2 - 2.0 * x1 + x0
+        if denom == 0.0:
+            # Sequence already (numerically) converged
+            return x2
+
+        accel = max(0.0, min(1.0, x0 - (x1 - x0) ** 2 / denom))
+        if abs(accel - x0) < tol:
+            return accel
+        x0 = accel
+
+    return x0
 
 
 def phi_convergence_rate(x: float, iterations: int = 10) -> float:
@@ -149,14 +198,12 @@ def phi_smooth_product(values: List[float], n: int = 3) -> float:
 
     Each value is smoothed individually, then product is smoothed
     Used in RDoD calculation (combining test, confirm, psi)
-    """
-    # Smooth each value
-    smoothed = [phi_smooth_recursive(v, n) for v in values]
 
-    # Calculate product
-    product = 1.0
-    for v in smoothed:
-        product *= v
+    The smoothing is one vectorized pass and the product a NumPy reduction,
+    replacing the sequential Python multiply chain
+    """
+    smoothed = np.asarray(phi_smooth_cascade(values, n))
+    product = float(np.prod(smoothed)) if smoothed.size else 1.0
 
     # Smooth the product
     return phi_smooth_recursive(product, n)
@@ -171,12 +218,10 @@ def phi_smooth_weighted(values: List[float], weights: List[float], n: int = 3) -
     if len(values) != len(weights):
         raise ValueError("Values and weights must have same length")
 
-    result = 1.0
-    for v, w in zip(values, weights):
-        smoothed = phi_smooth_power(v, w, n)
-        result *= smoothed
-
-    return result
+    # Weight-power, smooth, and reduce in whole-array operations
+    powered = np.maximum(np.asarray(values, dtype=np.float64), 0.0) ** np.asarray(weights, dtype=np.float64)
+    smoothed = np.clip(1.0 - (1.0 - np.clip(powered, 0.0, 1.0)) * _PHI_INV ** n, 0.0, 1.0)
+    return float(np.prod(smoothed)) if smoothed.size else 1.0
 
 
 # ============================================================================
@@ -209,6 +254,43 @@ def rdod_recursive(
     return sigma * psi_smooth * test_smooth * conf_smooth * (1.0 - distortion)
 
 
+def rdod_recursive_batch(
+    psi,
+    tests=0.998,
+    confirm=0.999,
+    distortion: float = 0.00023,
+    phi_depth: int = 3
+) -> np.ndarray:
+    """
+    Vectorized rdod_recursive over arrays of samples
+
+    Accepts array-likes (scalars broadcast) for psi/tests/confirm and
+    evaluates the closed-form smoothing of all three components in whole-
+    array operations - one pass instead of three Python calls per sample
+
+    Returns: ndarray of RDoD coefficients [0, 1]
+    """
+    a = _PHI_INV ** phi_depth
+
+    def smooth_pow(values, exponent):
+        v = np.clip(np.maximum(np.asarray(values, dtype=np.float64), 0.0) ** exponent, 0.0, 1.0)
+        return np.clip(1.0 - (1.0 - v) * a, 0.0, 1.0)
+
+    return (
+        smooth_pow(psi, 0.5) *
+        smooth_pow(tests, 0.3) *
+        smooth_pow(confirm, 0.2) *
+        (1.0 - distortion)
+    )
+
+
+# The depth-d recursion is affine, x_d = A·x + (1-A) with A = φ⁻ᵈ, so the
+# substrate depths reduce to one multiply-add against these constants
+_A7 = _PHI_INV ** 7
+_A8 = _PHI_INV ** 8
+_A9 = _PHI_INV ** 9
+
+
 def sovereignty_recursive(value: float, depth: int = 7) -> float:
     """
     Deep sovereignty recursion (depth=7 for complete stabilization)
@@ -216,6 +298,8 @@ def sovereignty_recursive(value: float, depth: int = 7) -> float:
     Applies deep phi-smoothing to achieve sovereign state
     depth=7 corresponds to 0.7777 substrate (STABILIZATION)
     """
+    if depth == 7:
+        return _A7 * max(0.0, min(1.0, float(value))) + (1.0 - _A7)
     return phi_smooth_recursive(value, depth)
 
 
@@ -225,6 +309,8 @@ def transcendence_recursive(value: float, depth: int = 8) -> float:
 
     depth=8 corresponds to 0.8888 substrate (TRANSCENDENCE)
     """
+    if depth == 8:
+        return _A8 * max(0.0, min(1.0, float(value))) + (1.0 - _A8)
     return phi_smooth_recursive(value, depth)
 
 
@@ -234,36 +320,60 @@ def unity_recursive(value: float, depth: int = 9) -> float:
 
     depth=9 corresponds to 0.9999 substrate (UNITY)
     """
+    if depth == 9:
+        return _A9 * max(0.0, min(1.0, float(value))) + (1.0 - _A9)
     return phi_smooth_recursive(value, depth)
 
 
-# ============================================================================
-# RECURSIVE FACTORY
-# ============================================================================
+# (A, 1-A) per substrate code with A = φ⁻ᵈᵉᵖᵗʰ, so substrate smoothing is one
+# dict lookup and one multiply-add regardless of depth
+_DEPTH_COEF = {
+    0.7777: (_A7, 1.0 - _A7),  # STABILIZATION
+    0.8888: (_A8, 1.0 - _A8),  # TRANSCENDENCE
+    0.9999: (_A9, 1.0 - _A9),  # UNITY
+}
+_DEPTH_COEF_DEFAULT = (_PHI_INV ** 3, 1.0 - _PHI_INV ** 3)
+
+
+def substrate_smooth(value: float, substrate_code: float) -> float:
+    """
+    Smooth a value at the depth its substrate calls for
 
+    Single dispatch replacing the sovereignty/transcendence/unity trio for
+    callers that hold a substrate code; unknown codes fall back to depth 3,
+    matching make_substrate_smoother
+    """
+    a, b = _DEPTH_COEF.get(substrate_code, _DEPTH_COEF_DEFAULT)
+    return a * max(0.0, min(1.0, float(value))) + b
+
+# Substrate code → recursion depth (approximate), built once
+_SUBSTRATE_DEPTHS = {
+    0.7777: 7,  # STABILIZATION
+    0.8888: 8,  # TRANSCENDENCE
+    0.9999: 9,  # UNITY
+}
+
+
+@functools.lru_cache(maxsize=None)
 def make_phi_smoother(depth: int) -> Callable[[float], float]:
     """
     Factory function creating custom phi-smoothers
 
     Returns a function that applies phi-smoothing at specified depth
+    Memoized: the handful of distinct depths share one closure each
     """
     return lambda x: phi_smooth_recursive(x, depth)
 
 
+@functools.lru_cache(maxsize=None)
 def make_substrate_smoother(substrate_code: float) -> Callable[[float], float]:
     """
     Create smoother calibrated to substrate code
 
     Maps substrate code to appropriate recursion depth
+    Memoized: repeated lookups return the same cached callable
     """
-    # Map substrate to depth (approximate)
-    depth_map = {
-        0.7777: 7,  # STABILIZATION
-        0.8888: 8,  # TRANSCENDENCE
-        0.9999: 9,  # UNITY
-    }
-
-    depth = depth_map.get(substrate_code, 3)  # Default to 3
+    depth = _SUBSTRATE_DEPTHS.get(substrate_code, 3)  # Default to 3
     return make_phi_smoother(depth)
 
 
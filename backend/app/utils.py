@@ -4,11 +4,24 @@ TUOL Utility Functions
 Helper functions for recognition, validation, and formatting
 """
 
+import bisect
+import functools
 import math
+import time
+from collections import defaultdict
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 
+import numpy as np
+
 from .constants import PHI, SIGMA, L_INFINITY, SUBSTRATE_CODES, TEAM_NODES
+from .constants import _PHI_POWERS_ARR
+
+# Reciprocals computed once: multiplies are considerably cheaper than
+# divides, and alignment checks also skip a per-call transcendental
+_INV_PHI = 1.0 / PHI
+_LOG_PHI = math.log(PHI)
+_INV_LOG_PHI = 1.0 / _LOG_PHI
 
 
 # ============================================================================
@@ -28,6 +41,20 @@ def validate_recognition_coefficient(value: float) -> bool:
     return 0.0 <= value <= 1.0
 
 
+def validate_recognition_coefficient_batch(values) -> np.ndarray:
+    """
+    Vectorized validate_recognition_coefficient for arrays of coefficients
+
+    Args:
+        values: Array-like of recognition coefficients
+
+    Returns:
+        Boolean ndarray, True where the coefficient is in [0, 1]
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    return (arr >= 0.0) & (arr <= 1.0)
+
+
 def validate_frequency(freq: float) -> bool:
     """
     Validate that a frequency is positive and non-zero
@@ -45,6 +72,15 @@ def validate_frequency(freq: float) -> bool:
 # SUBSTRATE OPERATIONS
 # ============================================================================
 
+# Substrate records keyed by quantized code (code × 10⁴), matching the scheme
+# in constants: integer keys hash cheaply and tolerate float noise in inputs
+_SUBSTRATE_BY_INT = {
+    int(round(code * 10000)): (code, *info)
+    for code, info in SUBSTRATE_CODES.items()
+}
+
+
+@functools.lru_cache(maxsize=None)
 def get_substrate_info(code: float) -> Optional[Dict[str, Any]]:
     """
     Get complete substrate information from code
@@ -54,17 +90,28 @@ def get_substrate_info(code: float) -> Optional[Dict[str, Any]]:
 
     Returns:
         Dictionary with name, frequency, phi_power, or None if not found
+        (cached - repeated lookups return the same dictionary)
     """
-    if code in SUBSTRATE_CODES:
-        name, freq, phi_pow = SUBSTRATE_CODES[code]
-        return {
-            "code": code,
-            "name": name,
-            "frequency": freq,
-            "phi_power": phi_pow,
-            "is_infinite": freq == math.inf
-        }
-    return None
+    record = _SUBSTRATE_BY_INT.get(int(round(code * 10000)))
+    if record is None:
+        return None
+
+    code, name, freq, phi_pow = record
+    return {
+        "code": code,
+        "name": name,
+        "frequency": freq,
+        "phi_power": phi_pow,
+        "is_infinite": freq == math.inf
+    }
+
+
+# Sorted substrate listing, built once - SUBSTRATE_CODES never changes at
+# runtime, so the per-call sort and dict rebuilds are paid at import instead
+_ALL_SUBSTRATES = tuple(
+    get_substrate_info(code)
+    for code in sorted(SUBSTRATE_CODES.keys())
+)
 
 
 def list_all_substrates() -> List[Dict[str, Any]]:
@@ -74,10 +121,7 @@ def list_all_substrates() -> List[Dict[str, Any]]:
     Returns:
         List of substrate dictionaries
     """
-    return [
-        get_substrate_info(code)
-        for code in sorted(SUBSTRATE_CODES.keys())
-    ]
+    return list(_ALL_SUBSTRATES)
 
 
 # ============================================================================
@@ -97,6 +141,14 @@ def get_node_info(node_name: str) -> Optional[Dict[str, Any]]:
     return TEAM_NODES.get(node_name)
 
 
+# Node listing with names merged in, built once for the same reason as
+# _ALL_SUBSTRATES above
+_ALL_NODES = tuple(
+    {"name": name, **info}
+    for name, info in TEAM_NODES.items()
+)
+
+
 def list_all_nodes() -> List[Dict[str, Any]]:
     """
     List all Team Paradox-Ouroboros nodes
@@ -104,10 +156,14 @@ def list_all_nodes() -> List[Dict[str, Any]]:
     Returns:
         List of node dictionaries with names
     """
-    return [
-        {"name": name, **info}
-        for name, info in TEAM_NODES.items()
-    ]
+    return list(_ALL_NODES)
+
+
+# Nodes grouped by type, indexed once: type queries become a dict lookup
+# instead of a full scan of TEAM_NODES
+_NODES_BY_TYPE: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+for _node in _ALL_NODES:
+    _NODES_BY_TYPE[_node["node_type"]].append(_node)
 
 
 def get_nodes_by_type(node_type: str) -> List[Dict[str, Any]]:
@@ -120,11 +176,7 @@ def get_nodes_by_type(node_type: str) -> List[Dict[str, Any]]:
     Returns:
         List of matching nodes
     """
-    return [
-        {"name": name, **info}
-        for name, info in TEAM_NODES.items()
-        if info["node_type"] == node_type
-    ]
+    return list(_NODES_BY_TYPE.get(node_type, ()))
 
 
 # ============================================================================
@@ -141,8 +193,16 @@ def phi_spiral(n: int, scale: float = 1.0) -> List[float]:
 
     Returns:
         List of phi-scaled values
+
+    One vectorized power expression replaces n interpreter-level pow calls;
+    spirals within the shared φ-power table (n ≤ 129, the common case) are a
+    slice-and-scale with no pow at all
     """
-    return [scale * (PHI ** i) for i in range(n)]
+    if n <= 0:
+        return []
+    if n <= _PHI_POWERS_ARR.size:
+        return (scale * _PHI_POWERS_ARR[:n]).tolist()
+    return (scale * PHI ** np.arange(n, dtype=np.float64)).tolist()
 
 
 def fibonacci(n: int) -> int:
@@ -154,13 +214,24 @@ def fibonacci(n: int) -> int:
 
     Returns:
         Fibonacci number
+
+    Uses fast doubling - F(2k) = F(k)·(2·F(k+1) − F(k)) and
+    F(2k+1) = F(k)² + F(k+1)² - walking the bits of n for O(log n)
+    bigint operations instead of n additions
     """
     if n <= 1:
         return n
-    a, b = 0, 1
-    for _ in range(2, n + 1):
-        a, b = b, a + b
-    return b
+
+    a, b = 0, 1  # F(0), F(1)
+    for bit in bin(n)[2:]:
+        # Doubling step: (F(k), F(k+1)) -> (F(2k), F(2k+1))
+        c = a * ((b << 1) - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a
 
 
 def phi_ratio(a: float, b: float) -> float:
@@ -176,14 +247,14 @@ def phi_ratio(a: float, b: float) -> float:
     """
     if b == 0:
         return 0.0
-    return (a / b) / PHI
+    return (a / b) * _INV_PHI
 
 
 # ============================================================================
 # TIME OPERATIONS
 # ============================================================================
 
-def format_timestamp(dt: datetime = None) -> str:
+def format_timestamp(dt: Optional[datetime] = None) -> str:
     """
     Format timestamp in ISO 8601 UTC format
 
@@ -198,6 +269,24 @@ def format_timestamp(dt: datetime = None) -> str:
     return dt.isoformat()
 
 
+def format_timestamp_fast() -> str:
+    """
+    Format the current UTC time in ISO 8601 without datetime construction
+
+    Produces the same string as format_timestamp() for the current instant,
+    built from time.gmtime and one f-string - for hot logging paths where
+    per-event datetime allocation shows up
+
+    Returns:
+        ISO 8601 formatted string
+    """
+    t = time.time()
+    s = time.gmtime(t)
+    us = int((t - int(t)) * 1e6)
+    return (f"{s.tm_year:04d}-{s.tm_mon:02d}-{s.tm_mday:02d}"
+            f"T{s.tm_hour:02d}:{s.tm_min:02d}:{s.tm_sec:02d}.{us:06d}+00:00")
+
+
 def parse_timestamp(timestamp: str) -> datetime:
     """
     Parse ISO 8601 timestamp
@@ -215,6 +304,10 @@ def parse_timestamp(timestamp: str) -> datetime:
 # FORMATTING
 # ============================================================================
 
+# (divisor, unit) per power-of-1000 band, indexed by log10(freq) // 3
+_FREQ_UNITS = ((1.0, "Hz"), (1e3, "kHz"), (1e6, "MHz"), (1e9, "GHz"))
+
+
 def format_frequency(freq: float) -> str:
     """
     Format frequency with appropriate units
@@ -224,22 +317,22 @@ def format_frequency(freq: float) -> str:
 
     Returns:
         Formatted string (e.g., "10.93 kHz", "1.23 MHz")
+
+    Unit selection is one log10-indexed table lookup instead of a branch
+    ladder; only the degenerate inputs (0, ∞, sub-unity, beyond GHz) branch
     """
     if freq == 0:
         return "0 Hz"
-    elif freq == math.inf:
+    if freq == math.inf:
         return "∞ Hz"
-    elif freq < 1e3:
+    if freq < 1.0:
         return f"{freq:.2f} Hz"
-    elif freq < 1e6:
-        return f"{freq/1e3:.2f} kHz"
-    elif freq < 1e9:
-        return f"{freq/1e6:.2f} MHz"
-    elif freq < 1e12:
-        return f"{freq/1e9:.2f} GHz"
-    else:
+    if freq >= 1e12:
         return f"{freq:.2e} Hz"
 
+    divisor, unit = _FREQ_UNITS[int(math.log10(freq)) // 3]
+    return f"{freq/divisor:.2f} {unit}"
+
 
 def format_scientific(value: float, precision: int = 3) -> str:
     """
@@ -257,6 +350,34 @@ def format_scientific(value: float, precision: int = 3) -> str:
     return f"{value:.{precision}e}"
 
 
+def format_ratio_as_percent(value: float, precision: int = 2) -> str:
+    """
+    Format a ratio (0.0-1.0) as a percentage string
+
+    Args:
+        value: Ratio value (0.0-1.0)
+        precision: Decimal places
+
+    Returns:
+        Percentage string
+    """
+    return f"{value * 100.0:.{precision}f}%"
+
+
+def format_percent(value: float, precision: int = 2) -> str:
+    """
+    Format a value already expressed in percent (0-100)
+
+    Args:
+        value: Percentage value (0-100)
+        precision: Decimal places
+
+    Returns:
+        Percentage string
+    """
+    return f"{value:.{precision}f}%"
+
+
 def format_percentage(value: float, precision: int = 2) -> str:
     """
     Format value as percentage
@@ -267,11 +388,13 @@ def format_percentage(value: float, precision: int = 2) -> str:
 
     Returns:
         Percentage string
+
+    Auto-detects the scale per call; callers that know their scale should
+    use format_ratio_as_percent or format_percent directly and skip the branch
     """
-    # Auto-detect if value is already in percentage (0-100) or ratio (0-1)
     if value <= 1.0:
-        value *= 100.0
-    return f"{value:.{precision}f}%"
+        return format_ratio_as_percent(value, precision)
+    return format_percent(value, precision)
 
 
 # ============================================================================
@@ -282,7 +405,7 @@ def generate_recognition_statement(
     entity: str,
     substrate: float,
     frequency: float,
-    role: str = None
+    role: Optional[str] = None
 ) -> str:
     """
     Generate formal recognition statement
@@ -305,6 +428,17 @@ def generate_recognition_statement(
     return statement
 
 
+# Upper bound and template per urgency bucket; bisect_left keeps the
+# original <= boundary semantics (0, 7, 30 days)
+_CONVERGENCE_BOUNDS = (0.0, 7.0, 30.0)
+_CONVERGENCE_TEMPLATES = (
+    "Convergence ACHIEVED at Omega point",
+    "Convergence IMMINENT: {d:.1f} days to Omega",
+    "Convergence APPROACHING: {d:.0f} days to Omega",
+    "Convergence trajectory: {d:.0f} days to Omega",
+)
+
+
 def generate_convergence_statement(days_remaining: float) -> str:
     """
     Generate convergence statement based on days remaining
@@ -315,14 +449,8 @@ def generate_convergence_statement(days_remaining: float) -> str:
     Returns:
         Convergence statement
     """
-    if days_remaining <= 0:
-        return "Convergence ACHIEVED at Omega point"
-    elif days_remaining <= 7:
-        return f"Convergence IMMINENT: {days_remaining:.1f} days to Omega"
-    elif days_remaining <= 30:
-        return f"Convergence APPROACHING: {days_remaining:.0f} days to Omega"
-    else:
-        return f"Convergence trajectory: {days_remaining:.0f} days to Omega"
+    template = _CONVERGENCE_TEMPLATES[bisect.bisect_left(_CONVERGENCE_BOUNDS, days_remaining)]
+    return template.format(d=days_remaining)
 
 
 # ============================================================================
@@ -344,17 +472,33 @@ def validate_phi_alignment(value: float, tolerance: float = 0.01) -> bool:
     if value <= 0:
         return False
 
-    log_val = math.log(value)
-    log_phi = math.log(PHI)
-
     # Calculate what power of phi this would be
-    n = log_val / log_phi
+    n = math.log(value) * _INV_LOG_PHI
 
     # Check if n is close to an integer
     n_rounded = round(n)
     return abs(n - n_rounded) < tolerance
 
 
+def validate_phi_alignment_batch(values, tolerance: float = 0.01) -> np.ndarray:
+    """
+    Vectorized validate_phi_alignment for arrays of values
+
+    Args:
+        values: Array-like of values to check
+        tolerance: Allowed deviation from an integer power of φ
+
+    Returns:
+        Boolean ndarray, True where the value is phi-aligned
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    positive = arr > 0
+
+    # log only where defined; non-positive entries are never aligned
+    n = np.log(arr, out=np.zeros_like(arr), where=positive) * _INV_LOG_PHI
+    return positive & (np.abs(n - np.round(n)) < tolerance)
+
+
 # ============================================================================
 # MAIN
 # ============================================================================
@@ -6,8 +6,9 @@ Test suite for TUOL core constants
 import sys
 import os
 
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+if __package__ in (None, ""):
+    # Direct script execution only - pytest gets the repo root from conftest.py
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from backend.app.constants import (
     PHI, SIGMA, L_INFINITY, RDOD_THRESHOLD, RDOD_NOW,
@@ -74,7 +75,7 @@ def test_goddess_streams():
     """Test 36 Goddess Streams"""
     print("\nTesting Goddess Streams...")
 
-    assert len(GODDESS_STREAMS) == 36, f"Expected 36 Goddess Streams, got {len(GODDESS_STREAMS)}"
+    assert len(GODDESS_STREAMS) == 36, "Expected 36 Goddess Streams"
 
     # Test that Atena-Ra is the 36th
     assert "Atena-Ra" in GODDESS_STREAMS, "Atena-Ra missing from streams"
@@ -124,7 +125,7 @@ def test_helper_functions():
 
     # Test substrate_name
     name = substrate_name(0.7777)
-    assert name == "STABILIZATION", f"Expected STABILIZATION, got {name}"
+    assert name == "STABILIZATION", "substrate_name(0.7777) mismatch"
     print(f"  ✓ substrate_name(0.7777) = {name}")
 
 
@@ -0,0 +1,11 @@
+"""
+Pytest configuration - make the repo root importable once
+
+Tests import `backend.app.*`; inserting the root here replaces the
+per-test-module sys.path manipulation.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))